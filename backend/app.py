@@ -4,16 +4,24 @@ Cricket Dashboard Backend API
 Flask server for cricket statistics data processing and API endpoints
 """
 
-from pdb import main
 import sys
 import os
+import time
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the parent directory to the path so we can import cricguru as a package
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, request, send_from_directory
 from flask_cors import CORS
+from flask_compress import Compress
 import json
+import orjson
+import numpy as np
 import pandas as pd
 from cricguru.player import Player
 import warnings
@@ -23,43 +31,153 @@ warnings.filterwarnings("ignore")
 app = Flask(__name__)
 CORS(app)  # Enable CORS for cross-origin requests
 
-
-def safe_convert(value, convert_type=int, default=0):
-    """Safely convert values handling various data types"""
-    try:
-        if pd.isna(value) or value == "" or value == "-":
-            return default
-        if convert_type == int:
-            return int(float(str(value).replace("*", "").replace("+", "")))
-        elif convert_type == float:
-            return float(str(value).replace("*", "").replace("+", ""))
-        else:
-            return str(value)
-    except:
-        return default
-
-
-def extract_player_data(player_id):
-    """Extract cricket data for a player and return as JSON"""
+# Gzip JSON and frontend assets for clients that send Accept-Encoding
+app.config["COMPRESS_MIMETYPES"] = [
+    "application/json",
+    "text/html",
+    "text/css",
+    "text/javascript",
+    "application/javascript",
+]
+app.config["COMPRESS_LEVEL"] = 6
+Compress(app)
+
+# Frontend assets, resolved once at import rather than per request
+FRONTEND_PATH = os.path.realpath(
+    os.path.join(os.path.dirname(__file__), "..", "frontend")
+)
+app.config["SERVE_FRONTEND"] = os.environ.get("SERVE_FRONTEND", "1") != "0"
+STATIC_MAX_AGE = 86400  # seconds
+
+# Cache scraped career summaries so repeat lookups skip the Cricinfo round-trip
+app.config["CACHE_CAREER_SUMMARY"] = os.environ.get("CACHE_CAREER_SUMMARY", "1") != "0"
+CAREER_CACHE_TTL = 3600  # seconds
+CAREER_CACHE_SIZE = 2048
+# (player_id, match_class) -> (expires_at, dataframe)
+_CAREER_CACHE = OrderedDict()
+_CAREER_CACHE_LOCK = threading.Lock()
+
+# Finished /api/player payloads: player_id -> (expires_at, body, gzip_body, etag)
+RESPONSE_CACHE_SIZE = 1024
+_RESPONSE_CACHE = OrderedDict()
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+# Format configurations
+FORMATS = {
+    "test": {"class": "1", "name": "Test Cricket"},
+    "odi": {"class": "2", "name": "ODI Cricket"},
+    "t20": {"class": "3", "name": "T20I Cricket"},
+}
+
+# Numeric columns used from the career summary table
+STAT_COLUMNS = ["Mat", "Runs", "HS", "Bat Av", "100", "Ct", "Wkts", "Bowl Av"]
+
+# Grouping values for empty or summary rows, which are not teams
+SKIP_GROUPINGS = frozenset({"", "Career", "Overall", "Total"})
+
+
+def dump_json(obj):
+    """Serialize obj to JSON bytes with orjson"""
+    return orjson.dumps(
+        obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
+
+
+def ojsonify(obj, status=200):
+    """jsonify replacement that serializes with orjson"""
+    return app.response_class(dump_json(obj), status=status, mimetype="application/json")
+
+
+def matching_etag(etag):
+    """Return the client's If-None-Match tag for etag, if it sent one.
+
+    Flask-Compress appends the encoding to the ETag of compressed responses
+    ("abc" becomes "abc:gzip"), so that suffix is ignored when comparing.
+    """
+    for client_etag in request.if_none_match.as_set():
+        if client_etag.split(":", 1)[0] == etag:
+            return client_etag
+    return None
+
+
+def safe_convert_col(series, convert_type=int, default=0):
+    """Safely convert a whole Series of stats values in one pass"""
+    # Cricinfo marks not-outs and similar with a trailing "*" or "+"
+    cleaned = series.astype("string").str.rstrip("*+")
+    cleaned = cleaned.mask(cleaned.isin(["", "-"]))
+    values = pd.to_numeric(cleaned, errors="coerce").astype("float64")
+    # Anything that is not a finite number falls back to default
+    values = values.where(np.isfinite(values), default)
+    if convert_type == int:
+        # Values outside the int64 range would wrap around in astype
+        values = values.where(values.abs() < 2**63, default)
+        return values.astype("int64")
+    return values
+
+
+def get_career_summary(player_id, match_class):
+    """Get the all-round career summary for a player in one match class.
+
+    Results are cached for CAREER_CACHE_TTL seconds. The returned dataframe
+    may be shared between requests, so callers must not modify it in place.
+    """
+    key = (player_id, match_class)
+    if app.config["CACHE_CAREER_SUMMARY"]:
+        with _CAREER_CACHE_LOCK:
+            entry = _CAREER_CACHE.get(key)
+            if entry is not None:
+                if entry[0] >= time.time():
+                    _CAREER_CACHE.move_to_end(key)
+                    return entry[1]
+                del _CAREER_CACHE[key]
+
+    cric_data = Player(player_id).career_summary(
+        query_params={"class": match_class, "type": "allround"}
+    )
+
+    if app.config["CACHE_CAREER_SUMMARY"]:
+        with _CAREER_CACHE_LOCK:
+            _CAREER_CACHE[key] = (time.time() + CAREER_CACHE_TTL, cric_data)
+            _CAREER_CACHE.move_to_end(key)
+            while len(_CAREER_CACHE) > CAREER_CACHE_SIZE:
+                _CAREER_CACHE.popitem(last=False)
+    return cric_data
+
+
+def career_cache_expiry(player_id):
+    """Earliest expiry among a player's cached career summaries"""
+    now = time.time()
+    with _CAREER_CACHE_LOCK:
+        expiries = [
+            _CAREER_CACHE.get((player_id, format_info["class"]), (now,))[0]
+            for format_info in FORMATS.values()
+        ]
+    return min(expiries)
+
+
+def extract_player_data(player_id, failed_formats=None):
+    """Extract cricket data for a player and return as JSON
+
+    Keys of formats whose scrape raised are appended to failed_formats,
+    if given.
+    """
     try:
-        player = Player(player_id)
-
         formats_data = {}
         player_info = {"player_id": player_id, "status": "success"}
 
-        # Format configurations
-        formats = {
-            "test": {"class": "1", "name": "Test Cricket"},
-            "odi": {"class": "2", "name": "ODI Cricket"},
-            "t20": {"class": "3", "name": "T20I Cricket"},
-        }
+        # Scrape all formats concurrently; each one is a blocking Cricinfo request
+        with ThreadPoolExecutor(max_workers=len(FORMATS)) as executor:
+            futures = {
+                format_key: executor.submit(
+                    get_career_summary, player_id, format_info["class"]
+                )
+                for format_key, format_info in FORMATS.items()
+            }
 
-        for format_key, format_info in formats.items():
+        for format_key, format_info in FORMATS.items():
             try:
                 # Get career summary data
-                career_data = player.career_summary(
-                    query_params={"class": format_info["class"], "type": "allround"}
-                )
+                career_data = futures[format_key].result()
 
                 if career_data is not None and not career_data.empty:
                     format_data = process_format_data(career_data)
@@ -72,6 +190,8 @@ def extract_player_data(player_id):
             except Exception as e:
                 print(f"✗ Error in {format_info['name']}: {str(e)}")
                 formats_data[format_key] = create_empty_format_data()
+                if failed_formats is not None:
+                    failed_formats.append(format_key)
 
         player_info["formats"] = formats_data
         return player_info
@@ -88,61 +208,42 @@ def extract_player_data(player_id):
 def process_format_data(df):
     """Process cricket dataframe for dashboard"""
 
-    # Calculate totals
-    total_matches = 0
-    total_runs = 0
-    highest_score = 0
-    total_centuries = 0
-    total_catches = 0
-    total_wickets = 0
+    # Skip empty or summary rows
+    grouping = df.get("Grouping", pd.Series("", index=df.index))
+    team_names = grouping.astype(str).str.strip()
+    mask = grouping.notna() & ~team_names.isin(SKIP_GROUPINGS)
+    # Columns missing from the scrape are reindexed in as NaN and default to 0
+    sub = df.loc[mask].reindex(columns=STAT_COLUMNS)
 
     # Process team-wise data
-    teams = []
-
-    for _, row in df.iterrows():
-        grouping = str(row.get("Grouping", "")).strip()
-
-        # Skip empty or summary rows
-        if grouping in ["", "Career", "Overall", "Total"] or pd.isna(grouping):
-            continue
-
-        matches = safe_convert(row.get("Mat", 0))
-        runs = safe_convert(row.get("Runs", 0))
-        hs = safe_convert(row.get("HS", 0))
-        avg = safe_convert(row.get("Bat Av", 0), float)
-        centuries = safe_convert(row.get("100", 0))
-        catches = safe_convert(row.get("Ct", 0))
-        wickets = safe_convert(row.get("Wkts", 0))
-        bowl_avg = safe_convert(row.get("Bowl Av", 0), float)
-
-        # Add to totals
-        total_matches += matches
-        total_runs += runs
-        total_centuries += centuries
-        total_catches += catches
-        total_wickets += wickets
-        if hs > highest_score:
-            highest_score = hs
-
-        # Create team data
-        team_data = {
-            "team": grouping,
-            "matches": matches,
-            "runs": runs,
-            "batting_average": avg,
-            "highest_score": hs,
-            "centuries": centuries,
-            "wickets": wickets,
-            "bowling_average": bowl_avg,
-            "catches": catches,
+    teams_df = pd.DataFrame(
+        {
+            "team": team_names[mask],
+            "matches": safe_convert_col(sub["Mat"]),
+            "runs": safe_convert_col(sub["Runs"]),
+            "batting_average": safe_convert_col(sub["Bat Av"], float),
+            "highest_score": safe_convert_col(sub["HS"]),
+            "centuries": safe_convert_col(sub["100"]),
+            "wickets": safe_convert_col(sub["Wkts"]),
+            "bowling_average": safe_convert_col(sub["Bowl Av"], float),
+            "catches": safe_convert_col(sub["Ct"]),
         }
-        teams.append(team_data)
+    )
+
+    # Calculate totals in a single pass over the summed columns
+    totals = teams_df[["matches", "runs", "centuries", "catches", "wickets"]].sum()
+    total_matches = int(totals["matches"])
+    total_runs = int(totals["runs"])
+    highest_score = int(teams_df["highest_score"].max()) if len(teams_df) else 0
+    total_centuries = int(totals["centuries"])
+    total_catches = int(totals["catches"])
+    total_wickets = int(totals["wickets"])
 
     # Calculate overall batting average
     batting_average = round(total_runs / total_matches, 2) if total_matches > 0 else 0
 
     # Sort teams by runs and limit to top performers
-    teams = sorted(teams, key=lambda x: x["runs"], reverse=True)[:10]
+    teams = teams_df.nlargest(10, "runs").to_dict(orient="records")
 
     overview = {
         "total_matches": total_matches,
@@ -173,46 +274,126 @@ def create_empty_format_data():
     }
 
 
+def get_cached_response(player_id):
+    """Return the cached (body, gzip_body, etag) for a player, if still fresh"""
+    with _RESPONSE_CACHE_LOCK:
+        entry = _RESPONSE_CACHE.get(player_id)
+        if entry is None:
+            return None
+        if entry[0] < time.time():
+            del _RESPONSE_CACHE[player_id]
+            return None
+        _RESPONSE_CACHE.move_to_end(player_id)
+        return entry[1:]
+
+
+def cache_response(player_id, data, store=True):
+    """Serialize and gzip a player payload once, caching the resulting bytes"""
+    body = dump_json(data)
+    gzip_body = gzip.compress(body, compresslevel=6)
+    etag = hashlib.blake2b(body, digest_size=12).hexdigest()
+
+    # Shares the career summary switch: no caching means fresh data every time
+    if store and app.config["CACHE_CAREER_SUMMARY"]:
+        # Expire with the career summaries the data was built from, so the
+        # two cache layers never stack up to more than one TTL
+        expires_at = career_cache_expiry(player_id)
+        with _RESPONSE_CACHE_LOCK:
+            _RESPONSE_CACHE[player_id] = (
+                expires_at,
+                body,
+                gzip_body,
+                etag,
+            )
+            _RESPONSE_CACHE.move_to_end(player_id)
+            while len(_RESPONSE_CACHE) > RESPONSE_CACHE_SIZE:
+                _RESPONSE_CACHE.popitem(last=False)
+
+    return body, gzip_body, etag
+
+
+def player_response(body, gzip_body, etag, cacheable=True):
+    """Build the /api/player response from pre-rendered bytes
+
+    Payloads that are not cacheable (some format failed to scrape) are
+    sent with Cache-Control: no-store and no ETag, so clients refetch.
+    """
+    # Let clients revalidate with If-None-Match and get a 304 back
+    client_etag = matching_etag(etag) if cacheable else None
+    if client_etag:
+        response = app.response_class(status=304)
+        response.set_etag(client_etag)
+    elif request.accept_encodings["gzip"]:
+        # Already compressed, so Flask-Compress leaves this response alone
+        response = app.response_class(gzip_body, mimetype="application/json")
+        response.headers["Content-Encoding"] = "gzip"
+        if cacheable:
+            response.set_etag(f"{etag}:gzip")
+    else:
+        response = app.response_class(body, mimetype="application/json")
+        if cacheable:
+            response.set_etag(etag)
+    if cacheable:
+        response.headers[
+            "Cache-Control"
+        ] = "public, max-age=300, stale-while-revalidate=3600"
+    else:
+        response.headers["Cache-Control"] = "no-store"
+    return response
+
+
 # API Routes
 @app.route("/api/player/<int:player_id>")
 def get_player_data(player_id):
     """API endpoint to get player data as JSON"""
     try:
-        data = extract_player_data(player_id)
-        return jsonify(data)
+        cached = get_cached_response(player_id)
+        if cached is None:
+            failed_formats = []
+            data = extract_player_data(player_id, failed_formats)
+            if data["status"] != "success":
+                return ojsonify(data)
+            # Don't pin a transient scrape failure in any cache
+            if failed_formats:
+                return player_response(
+                    *cache_response(player_id, data, store=False), cacheable=False
+                )
+            cached = cache_response(player_id, data)
+        return player_response(*cached)
     except Exception as e:
-        return (
-            jsonify(
-                {
-                    "player_id": player_id,
-                    "status": "error",
-                    "message": str(e),
-                    "formats": {},
-                }
-            ),
-            500,
+        return ojsonify(
+            {
+                "player_id": player_id,
+                "status": "error",
+                "message": str(e),
+                "formats": {},
+            },
+            status=500,
         )
 
 
 @app.route("/api/health")
 def health_check():
     """Health check endpoint"""
-    return jsonify({"status": "healthy", "service": "cricket-dashboard-api"})
+    return ojsonify({"status": "healthy", "service": "cricket-dashboard-api"})
 
 
 # Serve frontend files (for development)
-@app.route("/")
-def serve_frontend():
-    """Serve the frontend index.html"""
-    frontend_path = os.path.join(os.path.dirname(__file__), "..", "frontend")
-    return send_from_directory(frontend_path, "index.html")
-
-
-@app.route("/<path:filename>")
-def serve_static(filename):
-    """Serve static frontend files"""
-    frontend_path = os.path.join(os.path.dirname(__file__), "..", "frontend")
-    return send_from_directory(frontend_path, filename)
+# In production a reverse proxy can serve FRONTEND_PATH directly; set
+# SERVE_FRONTEND=0 to leave these routes out.
+if app.config["SERVE_FRONTEND"]:
+
+    @app.route("/")
+    def serve_frontend():
+        """Serve the frontend index.html"""
+        return send_from_directory(FRONTEND_PATH, "index.html")
+
+    @app.route("/<path:filename>")
+    def serve_static(filename):
+        """Serve static frontend files"""
+        return send_from_directory(
+            FRONTEND_PATH, filename, max_age=STATIC_MAX_AGE
+        )
 
 
 if __name__ == "__main__":
@@ -230,4 +411,10 @@ if __name__ == "__main__":
     print("  • 290630 - Babar Azam")
     print("\n" + "=" * 50)
 
-    app.run(debug=True, host="0.0.0.0", port=5000)
+    # The Werkzeug server is for development only; in production run
+    #   gunicorn -k gevent -w 4 -b 0.0.0.0:5000 wsgi:app
+    # from the backend directory so requests are not serialized.
+    debug = os.environ.get("FLASK_ENV") == "development"
+    if not debug:
+        print("⚠️  Development server - use gunicorn with wsgi:app in production")
+    app.run(debug=debug, host="0.0.0.0", port=5000, threaded=True)
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+WSGI entry point for the Cricket Dashboard Backend API
+Run with: gunicorn -k gevent -w 4 -b 0.0.0.0:5000 wsgi:app
+"""
+
+# Patch the standard library before anything imports sockets, so the
+# Cricinfo requests made by cricguru yield to other greenlets
+from gevent import monkey
+
+monkey.patch_all()
+
+from app import app  # noqa: E402,F401
+
+__all__ = ["app"]
@@ -5,7 +5,7 @@ classes cover teams and players data. The results are returned as a Pandas dataf
 data analysis on cricket data.
 
 New Features:
-- PlayerSearch: Search for cricket players by name and get their Cricinfo player IDs
+- search_espncricinfo_players: Search for cricket players by name and get their Cricinfo player IDs
 - Enhanced Player class integration with search functionality
 
 """
@@ -13,7 +13,6 @@ New Features:
 from .player import Player
 from .team import Team
 from .scraper import Scraper
+from .player_search import search_espncricinfo_players
 
-# from .player_search import PlayerSearch
-
-__all__ = ["Player", "Team", "Scraper"]
+__all__ = ["Player", "Team", "Scraper", "search_espncricinfo_players"]
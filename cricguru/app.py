@@ -7,6 +7,8 @@ Flask web application that serves cricket player data via JSON API
 from flask import Flask, request, jsonify, render_template
 from flask_cors import CORS
 import json
+from heapq import nlargest
+from operator import itemgetter
 import pandas as pd
 from cricguru.player import Player
 import warnings
@@ -16,6 +18,9 @@ warnings.filterwarnings("ignore")
 app = Flask(__name__)
 CORS(app)  # Enable CORS for cross-origin requests
 
+# Grouping values for empty or summary rows, which are not teams
+SKIP_GROUPINGS = frozenset({"", "Career", "Overall", "Total"})
+
 
 def safe_convert(value, convert_type=int, default=0):
     """Safely convert values handling various data types"""
@@ -28,7 +33,7 @@ def safe_convert(value, convert_type=int, default=0):
             return float(str(value).replace("*", "").replace("+", ""))
         else:
             return str(value)
-    except:
+    except (ValueError, TypeError, OverflowError):
         return default
 
 
@@ -81,61 +86,45 @@ def extract_player_data(player_id):
 def process_format_data(df):
     """Process cricket dataframe for dashboard"""
 
-    # Calculate totals
-    total_matches = 0
-    total_runs = 0
-    highest_score = 0
-    total_centuries = 0
-    total_catches = 0
-    total_wickets = 0
-
-    # Process team-wise data
-    teams = []
-
-    for _, row in df.iterrows():
-        grouping = str(row.get("Grouping", "")).strip()
-
-        # Skip empty or summary rows
-        if grouping in ["", "Career", "Overall", "Total"] or pd.isna(grouping):
-            continue
-
-        matches = safe_convert(row.get("Mat", 0))
-        runs = safe_convert(row.get("Runs", 0))
-        hs = safe_convert(row.get("HS", 0))
-        avg = safe_convert(row.get("Bat Av", 0), float)
-        centuries = safe_convert(row.get("100", 0))
-        catches = safe_convert(row.get("Ct", 0))
-        wickets = safe_convert(row.get("Wkts", 0))
-        bowl_avg = safe_convert(row.get("Bowl Av", 0), float)
-
-        # Add to totals
-        total_matches += matches
-        total_runs += runs
-        total_centuries += centuries
-        total_catches += catches
-        total_wickets += wickets
-        if hs > highest_score:
-            highest_score = hs
-
-        # Create team data
-        team_data = {
+    # itertuples yields plain namedtuples; iterrows built a full Series per row,
+    # which dominated the cost of this loop. Columns that are not valid
+    # identifiers are renamed so they stay reachable as attributes.
+    df = df.rename(columns={"Bat Av": "Bat_Av", "Bowl Av": "Bowl_Av", "100": "Hundreds"})
+    rows = (
+        (str(getattr(row, "Grouping", "")).strip(), row)
+        for row in df.itertuples(index=False)
+    )
+
+    # Process team-wise data, skipping empty or summary rows
+    teams = [
+        {
             "team": grouping,
-            "matches": matches,
-            "runs": runs,
-            "batting_average": avg,
-            "highest_score": hs,
-            "centuries": centuries,
-            "wickets": wickets,
-            "bowling_average": bowl_avg,
-            "catches": catches,
+            "matches": safe_convert(getattr(row, "Mat", 0)),
+            "runs": safe_convert(getattr(row, "Runs", 0)),
+            "batting_average": safe_convert(getattr(row, "Bat_Av", 0), float),
+            "highest_score": safe_convert(getattr(row, "HS", 0)),
+            "centuries": safe_convert(getattr(row, "Hundreds", 0)),
+            "wickets": safe_convert(getattr(row, "Wkts", 0)),
+            "bowling_average": safe_convert(getattr(row, "Bowl_Av", 0), float),
+            "catches": safe_convert(getattr(row, "Ct", 0)),
         }
-        teams.append(team_data)
+        for grouping, row in rows
+        if grouping not in SKIP_GROUPINGS
+    ]
+
+    # Calculate totals
+    total_matches = sum(team["matches"] for team in teams)
+    total_runs = sum(team["runs"] for team in teams)
+    highest_score = max((team["highest_score"] for team in teams), default=0)
+    total_centuries = sum(team["centuries"] for team in teams)
+    total_catches = sum(team["catches"] for team in teams)
+    total_wickets = sum(team["wickets"] for team in teams)
 
     # Calculate overall batting average
     batting_average = round(total_runs / total_matches, 2) if total_matches > 0 else 0
 
     # Sort teams by runs and limit to top performers
-    teams = sorted(teams, key=lambda x: x["runs"], reverse=True)[:10]
+    teams = nlargest(10, teams, key=itemgetter("runs"))
 
     overview = {
         "total_matches": total_matches,
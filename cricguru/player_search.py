@@ -5,11 +5,25 @@ This module provides functionality to search for cricket players by name
 and returns their Cricinfo player IDs and basic information.
 """
 
-import requests
-from bs4 import BeautifulSoup
+import logging
+
+import lxml.html
 import json
 import re
 
+from .session import SESSION, REQUEST_TIMEOUT
+
+log = logging.getLogger(__name__)
+
+# Player ID patterns, fused into one alternation:
+#   /player/123.html, /cricketers/name-123, or any number at the end
+_PLAYER_ID_RE = re.compile(r"/player/(\d+)\.html|/cricketers/[^/]+-(\d+)|-(\d+)$")
+
+
+def _link_text(anchor):
+    """Return the visible text of an <a> element with whitespace collapsed"""
+    return " ".join(anchor.text_content().split())
+
 
 def search_espncricinfo_players(player_name, max_results=10):
     """
@@ -30,38 +44,28 @@ def search_espncricinfo_players(player_name, max_results=10):
     """
     from urllib.parse import quote
 
-    print(f"🔍 Searching for: {player_name}")
+    log.debug("Searching for: %s", player_name)
 
     # ESPN Cricinfo's player search is best accessed via this endpoint:
     search_url = f"https://search.espncricinfo.com/ci/content/player/search.html?search={quote(player_name)};type=player"
-    print(f"📡 URL: {search_url}")
+    log.debug("URL: %s", search_url)
 
-    headers = {"User-Agent": "Mozilla/5.0"}
-    response = requests.get(search_url, headers=headers)
-    print(f"📊 Response status: {response.status_code}")
+    response = SESSION.get(search_url, timeout=REQUEST_TIMEOUT)
+    log.debug("Response status: %s", response.status_code)
 
     if response.status_code != 200:
-        print("❌ Failed to get response")
+        log.debug("Failed to get response")
         return []
 
-    soup = BeautifulSoup(response.text, "html.parser")
-    print(f"📄 Page title: {soup.title.string if soup.title else 'No title'}")
-    print(f"📝 Page length: {len(response.text)} characters")
+    # lxml refuses to parse an empty document
+    if not response.content.strip():
+        log.debug("Empty response body")
+        return []
 
-    results = []
+    # lxml parses the raw bytes in C and sniffs the page encoding itself
+    tree = lxml.html.fromstring(response.content)
+    log.debug("Page length: %d bytes", len(response.content))
 
-    # Player links are typically in <a> tags with href containing '/ci/content/player/'
-    print("🔗 Looking for player links...")
-    all_links = soup.find_all("a", href=True)
-    print(f"🔗 Found {len(all_links)} total links")
-    
-    # Let's see what kinds of links we have
-    print("📋 Sample links found:")
-    for i, a in enumerate(all_links[:10]):  # Show first 10 links
-        href = a["href"]
-        text = a.get_text(strip=True)
-        print(f"  {i+1}. {href} -> '{text}'")
-    
     # Look for any links that might be player-related
     player_patterns = [
         "/ci/content/player/",
@@ -70,50 +74,39 @@ def search_espncricinfo_players(player_name, max_results=10):
         "cricketers"
     ]
     
-    print(f"\n� Checking for player patterns: {player_patterns}")
     potential_players = []
     
     for pattern in player_patterns:
-        matching_links = []
-        for a in all_links:
-            href = a["href"]
-            if pattern in href:
-                matching_links.append((href, a.get_text(strip=True)))
+        # Filter in XPath so the href matching runs inside libxml2
+        matching_links = [
+            (a.get("href"), _link_text(a))
+            for a in tree.xpath("//a[contains(@href, $pattern)]", pattern=pattern)
+        ]
         
-        print(f"Pattern '{pattern}': {len(matching_links)} matches")
-        if matching_links:
-            print("  Examples:")
-            for href, text in matching_links[:3]:
-                print(f"    {href} -> '{text}'")
-            potential_players.extend(matching_links[:5])  # Take first 5 from each pattern
+        log.debug("Pattern %r: %d matches", pattern, len(matching_links))
+        potential_players.extend(matching_links[:5])  # Take first 5 from each pattern
     
-    print(f"\n👤 Total potential players found: {len(potential_players)}")
+    # The patterns overlap, so the same link can be collected more than once
+    potential_players = list(dict.fromkeys(potential_players))
+    log.debug("Total potential players found: %d", len(potential_players))
     
     results = []
+    seen_ids = set()
     
     for href, name in potential_players:
-        # Try different ID extraction patterns
+        # Extract the ID with a single pass over the href
         player_id = None
-        
-        # Pattern 1: /player/123.html
-        match = re.search(r"/player/(\d+)\.html", href)
+        match = _PLAYER_ID_RE.search(href)
         if match:
-            player_id = match.group(1)
-        
-        # Pattern 2: /cricketers/name-123
-        if not player_id:
-            match = re.search(r"/cricketers/[^/]+-(\d+)", href)
-            if match:
-                player_id = match.group(1)
+            player_id = match.group(1) or match.group(2) or match.group(3)
         
-        # Pattern 3: Any number at the end
-        if not player_id:
-            match = re.search(r"-(\d+)$", href)
-            if match:
-                player_id = match.group(1)
+        # One result per player, even if it is linked under several URL shapes
+        if player_id in seen_ids:
+            continue
         
         if player_id and name:
-            print(f"✅ Found player: {name} (ID: {player_id})")
+            seen_ids.add(player_id)
+            log.debug("Found player: %s (ID: %s)", name, player_id)
             
             url = (
                 f"https://www.espncricinfo.com{href}"
@@ -134,13 +127,13 @@ def search_espncricinfo_players(player_name, max_results=10):
             if len(results) >= max_results:
                 break
     
-    print(f"🎯 Final results: {len(results)} players found")
+    log.debug("Final results: %d players found", len(results))
     return results
 
 
-
-for i in search_espncricinfo_players("Kohli"):
-    print(i)
+if __name__ == "__main__":
+    for i in search_espncricinfo_players("Kohli"):
+        print(i)
 
 
 # class PlayerSearch:
@@ -3,9 +3,10 @@ from collections import OrderedDict
 from urllib.parse import urlencode
 
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
+from .session import SESSION, REQUEST_TIMEOUT
+
 
 # Get all data for given query parameters
 # ------------- Note -------------
@@ -32,7 +33,7 @@ class Scraper:
             headers = {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/107.0.0.0 Safari/537.36"
             }
-            response = requests.get(url, headers=headers)
+            response = SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
             soup = BeautifulSoup(response.content, "html.parser")
 
             tables = soup.find_all("table")
@@ -86,7 +87,7 @@ class Scraper:
         encoded_params = urlencode(self.query_params)
 
         url = url.format(str(player_id), encoded_params)
-        response = requests.get(url, headers=headers)
+        response = SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
         soup = BeautifulSoup(response.content, "html.parser")
 
         tables = soup.find_all("table")
@@ -115,7 +116,7 @@ class Scraper:
         encoded_params = urlencode(self.query_params)
 
         url = url.format(str(player_id), encoded_params)
-        response = requests.get(url, headers=headers)
+        response = SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
         soup = BeautifulSoup(response.content, "html.parser")
 
         tables = soup.find_all("table")
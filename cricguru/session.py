@@ -0,0 +1,32 @@
+"""Shared HTTP session for Cricinfo requests
+
+Every query goes to the same few ESPN Cricinfo hosts, so a single pooled
+session keeps TCP/TLS connections alive between calls instead of opening
+a new one per request.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) timeout in seconds so a hung Cricinfo response cannot
+# block a worker forever
+REQUEST_TIMEOUT = (3.05, 10)
+
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "Mozilla/5.0"})
+
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=64,
+    # raise_on_status=False hands back the last response once retries run
+    # out, so callers can still check status_code themselves
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False,
+    ),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
@@ -43,7 +43,7 @@ echo "🏏 Starting Cricket Dashboard Backend..."
 echo "======================================="
 
 cd backend
-python3 app.py &
+gunicorn -k gevent -w 4 -b 0.0.0.0:5000 wsgi:app &
 BACKEND_PID=$!
 
 echo "Backend started with PID: $BACKEND_PID"